@@ -1,59 +1,123 @@
-import json
+import os
 import sys
-from collections import defaultdict
-from ai.knowledge.knowledge_loader import load_service_capabilities
-
+import tempfile
+from collections import Counter
 
-def enrich_plan(plan_file: str, output_file: str):
-    with open(plan_file) as f:
-        plan = json.load(f)
-
-    service_caps = load_service_capabilities()
+import ijson
+import orjson
 
-    enriched = {
-        "resources": [],
-        "capabilities_detected": defaultdict(bool),
-        "summary": {"create": 0, "update": 0, "delete": 0}
-    }
-
-    for rc in plan.get("resource_changes", []):
-        rtype = rc["type"]
-        action = rc["change"]["actions"][0]
+from ai.knowledge.knowledge_loader import load_service_capabilities
 
-        enriched["summary"][action] += 1
+PUBLIC_CONTAINER_ACCESS = ("blob", "container")
 
-        caps = service_caps.get(rtype, [])
+# Unchanged ("no-op") and data-source ("read") entries are not part of the
+# change under review and must not contribute capabilities or counts.
+IGNORED_ACTIONS = frozenset({"no-op", "read"})
 
-        resource_entry = {
-            "type": rtype,
-            "action": action,
-            "capabilities": caps,
-            "flags": {}
-        }
 
-        # Detect PUBLIC exposure generically
-        after = rc["change"].get("after", {}) or {}
-        if after.get("container_access_type") in ["blob", "container"]:
-            resource_entry["flags"]["public_exposure"] = True
+def iter_resource_changes(plan_file: str):
+    """
+    Streams `resource_changes` from a Terraform plan one entry at a time.
+    Large plans are never materialized in memory as a whole.
+    """
+    with open(plan_file, "rb") as f:
+        try:
+            yield from ijson.items(f, "resource_changes.item", use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid Terraform plan JSON: {plan_file}") from e
 
-        if after.get("public_network_access_enabled") is True:
-            resource_entry["flags"]["public_exposure"] = True
 
-        if after.get("allow_nested_items_to_be_public") is True:
-            resource_entry["flags"]["public_exposure"] = True
+def classify_resource(rtype: str, after: dict, service_caps: dict) -> tuple:
+    """
+    Returns (capabilities, flags) for a single planned resource.
+    """
+    caps = service_caps.get(rtype, ())
+    flags = {}
 
-        for cap in caps:
-            enriched["capabilities_detected"][cap] = True
+    # Detect PUBLIC exposure generically
+    if (
+        after.get("container_access_type") in PUBLIC_CONTAINER_ACCESS
+        or after.get("public_network_access_enabled") is True
+        or after.get("allow_nested_items_to_be_public") is True
+    ):
+        flags["public_exposure"] = True
 
-        if resource_entry["flags"].get("public_exposure"):
-            enriched["capabilities_detected"]["public_exposure"] = True
+    return caps, flags
 
-        enriched["resources"].append(resource_entry)
 
-    enriched["capabilities_detected"] = dict(enriched["capabilities_detected"])
+def enrich_plan(plan_file: str, output_file: str):
+    service_caps = load_service_capabilities()
 
-    with open(output_file, "w") as f:
-        json.dump(enriched, f, indent=2)
+    capabilities_detected = {}
+    summary = Counter(create=0, update=0, delete=0)
+
+    # Large plans repeat the same resource shape many times (e.g. hundreds
+    # of identical subnets), so each distinct signature is classified once.
+    classified = {}
+
+    # Resources are written as they are enriched so that at most one
+    # resource entry is held in memory at a time. Output goes to a temp file
+    # that only replaces output_file once the whole plan has been read.
+    out_dir = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_file = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(b'{\n  "resources": [')
+            separator = b"\n    "
+
+            for rc in iter_resource_changes(plan_file):
+                rtype = sys.intern(rc["type"])
+                action = rc["change"]["actions"][0]
+
+                if action in IGNORED_ACTIONS:
+                    continue
+
+                summary[action] += 1
+
+                after = rc["change"].get("after", {}) or {}
+                signature = (
+                    rtype,
+                    after.get("container_access_type") in PUBLIC_CONTAINER_ACCESS,
+                    after.get("public_network_access_enabled") is True,
+                    after.get("allow_nested_items_to_be_public") is True,
+                )
+
+                if signature not in classified:
+                    caps, flags = classify_resource(rtype, after, service_caps)
+                    classified[signature] = (caps, flags)
+
+                    capabilities_detected.update(dict.fromkeys(caps, True))
+
+                    if flags.get("public_exposure"):
+                        capabilities_detected["public_exposure"] = True
+
+                caps, flags = classified[signature]
+
+                out.write(separator)
+                out.write(orjson.dumps({
+                    "type": rtype,
+                    "action": action,
+                    "capabilities": caps,
+                    "flags": flags
+                }))
+                separator = b",\n    "
+
+            out.write(b"\n  ],\n  \"capabilities_detected\": ")
+            out.write(orjson.dumps(capabilities_detected))
+            out.write(b',\n  "summary": ')
+            out.write(orjson.dumps(summary))
+            out.write(b"\n}\n")
+
+        # mkstemp creates the file 0600; give it the mode a plain open() would.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_file, 0o666 & ~umask)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
 
     print(f"SUCCESS: Enriched context written to {output_file}")
 
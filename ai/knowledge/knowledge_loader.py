@@ -1,58 +1,93 @@
-import json
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 # Base directory of this file
 BASE_PATH = Path(__file__).parent
 
+# Loaders are cached per process: the returned dicts are shared between
+# callers and MUST be treated as read-only.
+
 
 # -------------------------------------------------
 # Risk Pattern Definitions
 # -------------------------------------------------
 
+@lru_cache(maxsize=1)
 def load_risk_patterns() -> dict:
     """
     Loads universal risk patterns and their base scores.
     These patterns are cloud-agnostic and stable.
+    Pattern names are interned for fast dict/set lookups.
     """
-    with open(BASE_PATH / "risk_patterns.json", "r") as f:
-        data = json.load(f)
-    return data.get("patterns", {})
+    with open(BASE_PATH / "risk_patterns.json", "rb") as f:
+        data = orjson.loads(f.read())
+    return {sys.intern(name): info for name, info in data.items()}
 
 
 # -------------------------------------------------
 # Service → Capability Mapping
 # -------------------------------------------------
 
+@lru_cache(maxsize=1)
 def load_service_capabilities() -> dict:
     """
     Maps Terraform resource types to risk patterns.
     Adding a new Azure service requires only updating JSON.
+    Capabilities are frozen to tuples so the shared table is safe to reuse,
+    and resource types are interned for fast lookups.
     """
-    with open(BASE_PATH / "service_capabilities.json", "r") as f:
-        return json.load(f)
+    with open(BASE_PATH / "service_capabilities.json", "rb") as f:
+        data = orjson.loads(f.read())
+    return {
+        sys.intern(rtype): tuple(sys.intern(cap) for cap in caps)
+        for rtype, caps in data.items()
+    }
 
 
 # -------------------------------------------------
 # Security Severity Definitions
 # -------------------------------------------------
 
+@lru_cache(maxsize=1)
 def load_security_severity() -> dict:
     """
     Defines security severity per risk pattern.
     Used to distinguish LOW / MEDIUM / HIGH / CRITICAL security issues.
     """
-    with open(BASE_PATH / "security_severity.json", "r") as f:
-        return json.load(f)
+    with open(BASE_PATH / "security_severity.json", "rb") as f:
+        data = orjson.loads(f.read())
+    return {sys.intern(name): info for name, info in data.items()}
 
 
 # -------------------------------------------------
 # Blocking Rules Definitions
 # -------------------------------------------------
 
+@lru_cache(maxsize=1)
 def load_blocking_rules() -> dict:
     """
     Loads blocking rules from the policies directory.
     These rules define which risk patterns should block deployments.
     """
-    with open(BASE_PATH / "../policies/blocking_rules.json", "r") as f:
-        return json.load(f)
+    with open(BASE_PATH / "../policies/blocking_rules.json", "rb") as f:
+        return orjson.loads(f.read())
+
+
+# -------------------------------------------------
+# Cache Control
+# -------------------------------------------------
+
+def clear_knowledge_cache():
+    """
+    Drops cached knowledge so the next load re-reads the JSON files.
+    """
+    for loader in (
+        load_risk_patterns,
+        load_service_capabilities,
+        load_security_severity,
+        load_blocking_rules,
+    ):
+        loader.cache_clear()
@@ -1,5 +1,9 @@
 import os
-from openai import AzureOpenAI
+
+# Request settings — part of the LLM cache key, so keep them here
+API_VERSION = "2024-02-15-preview"
+TEMPERATURE = 0.1
+MAX_TOKENS = 600
 
 
 class AzureLLMClient:
@@ -12,9 +16,12 @@ class AzureLLMClient:
     """
 
     def __init__(self):
+        # Imported lazily: the OpenAI SDK is slow to import and only needed here
+        from openai import AzureOpenAI
+
         self.client = AzureOpenAI(
             api_key=os.getenv("AZURE_OPENAI_KEY"),
-            api_version="2024-02-15-preview",
+            api_version=API_VERSION,
             azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
         )
 
@@ -29,8 +36,8 @@ class AzureLLMClient:
         """
         response = self.client.chat.completions.create(
             model=self.deployment,
-            temperature=0.1,
-            max_tokens=600,
+            temperature=TEMPERATURE,
+            max_tokens=MAX_TOKENS,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
@@ -1,59 +1,150 @@
-import json
+import copy
 import os
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 
-MEMORY_FILE = "ai/memory/pr_memory.json"
+import orjson
 
+MEMORY_FILE = "ai/memory/pr_memory.jsonl"
+LEGACY_MEMORY_FILE = "ai/memory/pr_memory.json"
+
+
+def migrate_legacy_memory():
+    """
+    One-time conversion of the old {"prs": [...]} JSON file to JSONL.
+    Does nothing once the JSONL file exists; the legacy file is left in place.
+    """
+    if os.path.exists(MEMORY_FILE) or not os.path.exists(LEGACY_MEMORY_FILE):
+        return
+
+    with open(LEGACY_MEMORY_FILE, "rb") as f:
+        prs = orjson.loads(f.read()).get("prs", [])
+
+    tmp_file = MEMORY_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        for entry in prs:
+            f.write(orjson.dumps(entry) + b"\n")
+    os.replace(tmp_file, MEMORY_FILE)
+
+
+def iter_memory():
+    """
+    Streams recorded PR entries (one JSON object per line).
+    """
+    migrate_legacy_memory()
 
-def load_memory() -> dict:
     if not os.path.exists(MEMORY_FILE):
-        return {"prs": []}
+        return
+
+    with open(MEMORY_FILE, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def load_memory() -> dict:
+    return {"prs": list(iter_memory())}
+
+
+def memory_file_stamp():
+    """
+    (mtime, size) of the memory file, or None when it does not exist.
+    Any write — in this process or another — changes the stamp.
+    """
+    try:
+        st = os.stat(MEMORY_FILE)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
-    with open(MEMORY_FILE, "r") as f:
-        return json.load(f)
+def load_memory_index() -> tuple:
+    """
+    Loads memory with an inverted index: environment → resource type → PR positions.
+    The result is cached until the memory file changes and must not be mutated.
+    """
+    migrate_legacy_memory()
+    return _memory_index(MEMORY_FILE, memory_file_stamp())
+
+
+@lru_cache(maxsize=1)
+def _memory_index(memory_file: str, stamp) -> tuple:
+    # Keyed on the file's path and stamp so stale indexes are never served.
+    prs = []
+    index = defaultdict(lambda: defaultdict(list))
+
+    for position, pr in enumerate(iter_memory()):
+        prs.append(pr)
+        for rtype in pr.get("resources_changed", []):
+            index[pr.get("environment")][rtype].append(position)
+
+    return tuple(prs), {
+        env: {rtype: tuple(positions) for rtype, positions in by_type.items()}
+        for env, by_type in index.items()
+    }
 
 
 def save_memory(memory: dict):
-    with open(MEMORY_FILE, "w") as f:
-        json.dump(memory, f, indent=2)
+    with open(MEMORY_FILE, "wb") as f:
+        for entry in memory.get("prs", []):
+            f.write(orjson.dumps(entry) + b"\n")
+
+    clear_memory_caches()
 
 
 def record_pr(pr_number: int, review: dict, outcome: str = "unknown"):
     """
     Append PR review outcome to memory.
     """
-    memory = load_memory()
-
     entry = {
         "pr_number": pr_number,
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "environment": review.get("environment"),
         "risk_level": review.get("risk_level"),
         "confidence": review.get("confidence"),
-        "resources_changed": list(
-            {r.get("type") for r in review.get("resources", [])}
-            if review.get("resources")
-            else []
+        "resources_changed": sorted(
+            {r["type"] for r in review.get("resources", []) if r.get("type")}
         ),
         "outcome": outcome
     }
 
-    memory["prs"].append(entry)
-    save_memory(memory)
+    migrate_legacy_memory()
+
+    with open(MEMORY_FILE, "ab") as f:
+        f.write(orjson.dumps(entry) + b"\n")
 
+    clear_memory_caches()
 
-def find_similar_prs(resources: list, environment: str) -> list:
+
+def find_similar_prs(resources, environment: str) -> list:
     """
     Find past PRs touching similar resources in same environment.
+    `resources` may be any iterable of resource types; order and
+    duplicates do not matter, so callers can pass a set directly.
+    Returns copies, so callers may modify them freely.
     """
-    memory = load_memory()
-    matches = []
+    migrate_legacy_memory()
+    matches = _similar_prs(
+        tuple(sorted(frozenset(resources))), environment, memory_file_stamp()
+    )
+    return copy.deepcopy(list(matches))
+
+
+@lru_cache(maxsize=512)
+def _similar_prs(resource_key: tuple, environment: str, stamp) -> tuple:
+    # Keyed on the sorted, de-duplicated resource types so that PRs with the
+    # same shape share one lookup, and on the memory file's stamp so entries
+    # appended by other processes are picked up. Served from the cached
+    # memory index and cleared whenever memory is written.
+    prs, index = load_memory_index()
+    by_type = index.get(environment, {})
+
+    positions = set().union(*(by_type.get(res, ()) for res in resource_key))
 
-    for pr in memory.get("prs", []):
-        if pr["environment"] != environment:
-            continue
+    return tuple(prs[i] for i in sorted(positions))
 
-        if any(res in pr["resources_changed"] for res in resources):
-            matches.append(pr)
 
-    return matches
+def clear_memory_caches():
+    _memory_index.cache_clear()
+    _similar_prs.cache_clear()
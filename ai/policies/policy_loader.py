@@ -1,9 +1,14 @@
-import json
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 BASE_PATH = Path(__file__).parent
 
 
+@lru_cache(maxsize=1)
 def load_policy_packs():
-    with open(BASE_PATH / "policy_packs.json", "r") as f:
-        return json.load(f)
+    # Cached per process — treat the returned dict as read-only
+    with open(BASE_PATH / "policy_packs.json", "rb") as f:
+        return orjson.loads(f.read())
+
@@ -1,3 +1,6 @@
+from itertools import chain
+
+
 def detect_intent(enriched_context: dict) -> str:
     """
     Detects the intent of a Terraform PR based on actions and patterns.
@@ -31,9 +34,7 @@ def detect_intent(enriched_context: dict) -> str:
     # -----------------------------------------
     # 3️⃣ Security hardening
     # -----------------------------------------
-    all_patterns = []
-    for r in resources:
-        all_patterns.extend(r.get("patterns", []))
+    all_patterns = set(chain.from_iterable(r.get("patterns", ()) for r in resources))
 
     if (
         "identity_boundary" in all_patterns
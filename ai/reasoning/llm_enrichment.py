@@ -1,29 +1,143 @@
-import json
-from ai.llm.llm_client import AzureLLMClient
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import orjson
+
+from ai.llm.llm_client import API_VERSION, MAX_TOKENS, TEMPERATURE, AzureLLMClient
 from ai.llm.prompts import SYSTEM_PROMPT, build_user_prompt
 
+LLM_UNAVAILABLE_EXPLANATION = (
+    "LLM explanation unavailable. "
+    "Proceeding with deterministic review."
+)
+
+LLM_CACHE_DIR = Path.home() / ".cache" / "ai-terraform-reviewer" / "llm"
+LLM_CACHE_MAX_ENTRIES = 500
+
+
+def llm_cache_key(system_prompt: str, user_prompt: str) -> str:
+    """
+    Digest of the exact request sent to the LLM: both rendered prompts,
+    the endpoint and deployment, and the client's request settings.
+    """
+    payload = orjson.dumps(
+        [
+            system_prompt,
+            user_prompt,
+            os.getenv("AZURE_OPENAI_ENDPOINT"),
+            os.getenv("AZURE_OPENAI_DEPLOYMENT"),
+            API_VERSION,
+            TEMPERATURE,
+            MAX_TOKENS,
+        ]
+    )
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+def read_cached_explanation(cache_file: Path):
+    """
+    Returns the cached explanation, or None on a miss.
+    Unreadable or corrupt entries are removed and treated as a miss.
+    """
+    try:
+        explanation = orjson.loads(cache_file.read_bytes())["llm_explanation"]
+        if isinstance(explanation, str):
+            return explanation
+    except FileNotFoundError:
+        return None
+    except Exception:
+        pass
+
+    try:
+        cache_file.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+    return None
+
+
+def write_cached_explanation(cache_file: Path, explanation: str):
+    """
+    Stores an explanation atomically and prunes the oldest entries.
+    Best-effort: failures are ignored.
+    """
+    tmp_file = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps({"llm_explanation": explanation}))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        if tmp_file and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        return
+
+    prune_llm_cache(cache_file.parent)
+
+
+def prune_llm_cache(cache_dir: Path, max_entries: int = None):
+    """
+    Keeps only the most recently written cache entries.
+    Best-effort: entries that vanish or cannot be removed are skipped.
+    """
+    if max_entries is None:
+        max_entries = LLM_CACHE_MAX_ENTRIES
+
+    entries = []
+    for entry in cache_dir.glob("*.json"):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            pass
+
+    if len(entries) <= max_entries:
+        return
+
+    entries.sort(reverse=True)
+    for _, entry in entries[max_entries:]:
+        try:
+            entry.unlink(missing_ok=True)
+        except OSError:
+            pass
+
 
 def enrich_with_llm(enriched_context: dict, ai_review: dict) -> dict:
     """
     Uses Azure OpenAI ONLY to enhance explanations.
     DOES NOT change risk, confidence, or decisions.
+    Explanations are cached on disk so identical re-runs skip the LLM call.
     """
 
+    # LLM secrets are optional for consumer repos — without a deployment the
+    # client cannot run, so skip setup entirely. Key/endpoint resolution
+    # (including the SDK's own env fallbacks) is left to the client.
+    if not os.getenv("AZURE_OPENAI_DEPLOYMENT"):
+        ai_review["llm_explanation"] = LLM_UNAVAILABLE_EXPLANATION
+        return ai_review
+
     try:
+        user_prompt = build_user_prompt(enriched_context, ai_review)
+        cache_file = LLM_CACHE_DIR / f"{llm_cache_key(SYSTEM_PROMPT, user_prompt)}.json"
+
+        cached = read_cached_explanation(cache_file)
+        if cached is not None:
+            ai_review["llm_explanation"] = cached
+            return ai_review
+
         client = AzureLLMClient()
 
-        explanation = client.explain_risk(
-            SYSTEM_PROMPT,
-            build_user_prompt(enriched_context, ai_review)
-        )
+        explanation = client.explain_risk(SYSTEM_PROMPT, user_prompt)
 
         ai_review["llm_explanation"] = explanation
 
     except Exception as e:
         # SAFE FALLBACK — never break CI
-        ai_review["llm_explanation"] = (
-            "LLM explanation unavailable. "
-            "Proceeding with deterministic review."
-        )
+        ai_review["llm_explanation"] = LLM_UNAVAILABLE_EXPLANATION
+        return ai_review
+
+    write_cached_explanation(cache_file, explanation)
 
     return ai_review
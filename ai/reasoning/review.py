@@ -1,9 +1,9 @@
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import yaml
 
-from ai.reasoning.llm_enrichment import enrich_with_llm
+import orjson
 
 
 # -------------------------------------------------
@@ -15,8 +15,40 @@ def load_repo_config():
     if not cfg.exists():
         return {"environment": "dev"}
 
-    with open(cfg) as f:
-        return yaml.safe_load(f)
+    # Keyed on mtime so edits to the config are picked up immediately
+    return parse_repo_config(str(cfg.resolve()), cfg.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def parse_repo_config(path: str, mtime_ns: int) -> dict:
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    with open(path) as f:
+        return yaml.load(f, Loader=loader)
+
+
+# -------------------------------------------------
+# Recommendations (constant per decision)
+# -------------------------------------------------
+
+PUBLIC_DATA_PLANE_RECOMMENDATIONS = (
+    "Disable public access to data services",
+    "Use private endpoints",
+    "Restrict network access",
+    "Require security approval",
+)
+
+ACTIVE_INFRA_RECOMMENDATIONS = (
+    "Ensure security hardening standards are followed",
+    "Confirm this change is intended for the environment",
+)
+
+SCAFFOLD_RECOMMENDATIONS = (
+    "LGTM from an infrastructure safety perspective.",
+)
 
 
 # -------------------------------------------------
@@ -44,12 +76,7 @@ def assess_risk(ctx: dict) -> dict:
             "reasons": [
                 "Public data plane exposure detected"
             ],
-            "recommendations": [
-                "Disable public access to data services",
-                "Use private endpoints",
-                "Restrict network access",
-                "Require security approval"
-            ]
+            "recommendations": list(PUBLIC_DATA_PLANE_RECOMMENDATIONS)
         }
 
     # -------------------------------------------------
@@ -66,10 +93,7 @@ def assess_risk(ctx: dict) -> dict:
             "reasons": [
                 "Active infrastructure introduced requiring human review"
             ],
-            "recommendations": [
-                "Ensure security hardening standards are followed",
-                "Confirm this change is intended for the environment"
-            ]
+            "recommendations": list(ACTIVE_INFRA_RECOMMENDATIONS)
         }
 
     # -------------------------------------------------
@@ -82,9 +106,7 @@ def assess_risk(ctx: dict) -> dict:
         "reasons": [
             "Create-only scaffold infrastructure without public exposure"
         ],
-        "recommendations": [
-            "LGTM from an infrastructure safety perspective."
-        ]
+        "recommendations": list(SCAFFOLD_RECOMMENDATIONS)
     }
 
 
@@ -93,8 +115,8 @@ def assess_risk(ctx: dict) -> dict:
 # -------------------------------------------------
 
 def main(input_file: str, output_file: str):
-    with open(input_file) as f:
-        ctx = json.load(f)
+    with open(input_file, "rb", buffering=65536) as f:
+        ctx = orjson.loads(f.read())
 
     config = load_repo_config()
     env = config.get("environment", "dev")
@@ -105,17 +127,36 @@ def main(input_file: str, output_file: str):
     # -------------------------------------------------
     # 🤖 LLM ALWAYS ENABLED (EXPLAINS ONLY)
     # -------------------------------------------------
+    from ai.reasoning.llm_enrichment import enrich_with_llm
+
     review = enrich_with_llm(ctx, review)
 
-    with open(output_file, "w") as f:
-        json.dump(review, f, indent=2)
+    with open(output_file, "wb", buffering=65536) as f:
+        f.write(orjson.dumps(review, option=orjson.OPT_INDENT_2))
 
     print("SUCCESS: Terraform AI review generated")
 
 
+def main_batch(pairs: list, max_workers: int = None):
+    """
+    Reviews several (enriched_context, ai_review) file pairs concurrently.
+    The LLM round-trip dominates each review, so threads overlap the waits.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda pair: main(*pair), pairs))
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python review.py <enriched_context.json> <ai_review.json>")
+    args = sys.argv[1:]
+    if not args or len(args) % 2:
+        print(
+            "Usage: python review.py <enriched_context.json> <ai_review.json> "
+            "[<enriched_context.json> <ai_review.json> ...]"
+        )
         sys.exit(1)
 
-    main(sys.argv[1], sys.argv[2])
+    pairs = list(zip(args[::2], args[1::2]))
+    if len(pairs) == 1:
+        main(*pairs[0])
+    else:
+        main_batch(pairs)
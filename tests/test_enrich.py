@@ -0,0 +1,146 @@
+import json
+import os
+
+import pytest
+
+from ai.context.enrich import enrich_plan
+
+
+def write_plan(path, resource_changes):
+    path.write_text(json.dumps({"resource_changes": resource_changes}))
+
+
+def change(rtype, action, after=None):
+    return {"type": rtype, "change": {"actions": [action], "after": after or {}}}
+
+
+def test_noop_and_read_changes_are_ignored(tmp_path):
+    plan = tmp_path / "tfplan.json"
+    out = tmp_path / "enriched_context.json"
+    write_plan(plan, [
+        change("azurerm_storage_account", "no-op", {"public_network_access_enabled": True}),
+        change("azurerm_client_config", "read"),
+        change("azurerm_subnet", "create"),
+        change("azurerm_subnet", "create"),
+    ])
+
+    enrich_plan(str(plan), str(out))
+    enriched = json.loads(out.read_text())
+
+    assert [r["type"] for r in enriched["resources"]] == ["azurerm_subnet"] * 2
+    assert enriched["capabilities_detected"] == {"network_boundary": True}
+    assert enriched["summary"] == {"create": 2, "update": 0, "delete": 0}
+
+
+def test_output_round_trips_for_empty_plan(tmp_path):
+    plan = tmp_path / "tfplan.json"
+    out = tmp_path / "enriched_context.json"
+    write_plan(plan, [])
+
+    enrich_plan(str(plan), str(out))
+
+    assert json.loads(out.read_text()) == {
+        "resources": [],
+        "capabilities_detected": {},
+        "summary": {"create": 0, "update": 0, "delete": 0},
+    }
+
+
+def test_output_round_trips_for_single_resource(tmp_path):
+    plan = tmp_path / "tfplan.json"
+    out = tmp_path / "enriched_context.json"
+    write_plan(plan, [
+        change("azurerm_storage_container", "create", {"container_access_type": "blob"}),
+    ])
+
+    enrich_plan(str(plan), str(out))
+
+    assert json.loads(out.read_text()) == {
+        "resources": [{
+            "type": "azurerm_storage_container",
+            "action": "create",
+            "capabilities": ["data_plane"],
+            "flags": {"public_exposure": True},
+        }],
+        "capabilities_detected": {"data_plane": True, "public_exposure": True},
+        "summary": {"create": 1, "update": 0, "delete": 0},
+    }
+
+
+def test_output_round_trips_for_many_resources(tmp_path):
+    plan = tmp_path / "tfplan.json"
+    out = tmp_path / "enriched_context.json"
+    write_plan(plan, (
+        [change("azurerm_subnet", "create")] * 500
+        + [change("azurerm_linux_virtual_machine", "update")]
+        + [change("azurerm_virtual_network", "delete")]
+    ))
+
+    enrich_plan(str(plan), str(out))
+    enriched = json.loads(out.read_text())
+
+    assert len(enriched["resources"]) == 502
+    assert enriched["resources"][-1] == {
+        "type": "azurerm_virtual_network",
+        "action": "delete",
+        "capabilities": ["network_boundary"],
+        "flags": {},
+    }
+    assert enriched["capabilities_detected"] == {
+        "network_boundary": True,
+        "compute_plane": True,
+    }
+    assert enriched["summary"] == {"create": 500, "update": 1, "delete": 1}
+
+
+def test_output_has_default_file_mode(tmp_path):
+    plan = tmp_path / "tfplan.json"
+    out = tmp_path / "enriched_context.json"
+    write_plan(plan, [])
+
+    umask = os.umask(0o022)
+    try:
+        enrich_plan(str(plan), str(out))
+    finally:
+        os.umask(umask)
+
+    assert out.stat().st_mode & 0o777 == 0o644
+
+
+def test_structured_after_values_are_classified(tmp_path):
+    plan = tmp_path / "tfplan.json"
+    out = tmp_path / "enriched_context.json"
+    write_plan(plan, [
+        change("azurerm_storage_account", "create", {
+            "container_access_type": ["blob"],
+            "public_network_access_enabled": {"value": True},
+            "allow_nested_items_to_be_public": [],
+        }),
+        change("azurerm_storage_account", "create", {
+            "public_network_access_enabled": True,
+        }),
+    ])
+
+    enrich_plan(str(plan), str(out))
+    enriched = json.loads(out.read_text())
+
+    assert [r["flags"] for r in enriched["resources"]] == [
+        {},
+        {"public_exposure": True},
+    ]
+
+
+def test_invalid_plan_keeps_existing_output(tmp_path):
+    plan = tmp_path / "tfplan.json"
+    out = tmp_path / "enriched_context.json"
+    plan.write_text('{"resource_changes": [{"type": "azurerm_subnet", "change"')
+    out.write_text('{"previous": true}')
+
+    with pytest.raises(ValueError):
+        enrich_plan(str(plan), str(out))
+
+    assert json.loads(out.read_text()) == {"previous": True}
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "enriched_context.json",
+        "tfplan.json",
+    ]
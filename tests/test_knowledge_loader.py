@@ -0,0 +1,13 @@
+import json
+
+from ai.knowledge.knowledge_loader import BASE_PATH, load_risk_patterns
+
+
+def test_load_risk_patterns_returns_every_pattern():
+    with open(BASE_PATH / "risk_patterns.json") as f:
+        expected = json.load(f)
+
+    patterns = load_risk_patterns()
+
+    assert patterns == expected
+    assert patterns["public_exposure"]["base_score"] == 5
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from ai.reasoning import llm_enrichment
+
+
+class FakeClient:
+    calls = 0
+
+    def explain_risk(self, system_prompt, user_prompt):
+        FakeClient.calls += 1
+        return "fresh explanation"
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, tmp_path):
+    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT", "test-deployment")
+    monkeypatch.setattr(llm_enrichment, "LLM_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(llm_enrichment, "AzureLLMClient", FakeClient)
+    FakeClient.calls = 0
+
+
+def cache_file_for(ctx, review):
+    user_prompt = llm_enrichment.build_user_prompt(ctx, review)
+    key = llm_enrichment.llm_cache_key(llm_enrichment.SYSTEM_PROMPT, user_prompt)
+    return llm_enrichment.LLM_CACHE_DIR / f"{key}.json"
+
+
+def test_second_run_is_served_from_cache(fake_llm):
+    ctx = {"summary": {"create": 1}}
+
+    first = llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+    second = llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+
+    assert first["llm_explanation"] == second["llm_explanation"] == "fresh explanation"
+    assert FakeClient.calls == 1
+
+
+def test_corrupt_cache_entry_is_a_miss_and_removed(fake_llm):
+    ctx = {"summary": {"create": 1}}
+    cache_file = cache_file_for(ctx, {"risk_level": "LOW"})
+    cache_file.write_bytes(b"{trunc")
+
+    review = llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+
+    assert review["llm_explanation"] == "fresh explanation"
+    assert FakeClient.calls == 1
+    assert cache_file.read_bytes() == b'{"llm_explanation":"fresh explanation"}'
+
+
+def test_prompt_change_invalidates_cache(fake_llm, monkeypatch):
+    ctx = {"summary": {"create": 1}}
+
+    llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+    monkeypatch.setattr(
+        llm_enrichment, "build_user_prompt", lambda c, r: f"new template {c} {r}"
+    )
+    llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+
+    assert FakeClient.calls == 2
+
+
+def test_endpoint_change_invalidates_cache(fake_llm, monkeypatch):
+    ctx = {"summary": {"create": 1}}
+
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://one.example.com")
+    llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://two.example.com")
+    llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+
+    assert FakeClient.calls == 2
+
+
+def test_cache_keeps_only_newest_entries(fake_llm, monkeypatch):
+    monkeypatch.setattr(llm_enrichment, "LLM_CACHE_MAX_ENTRIES", 2)
+
+    for create in range(3):
+        ctx = {"summary": {"create": create}}
+        llm_enrichment.enrich_with_llm(ctx, {"risk_level": "LOW"})
+        # Distinct, increasing mtimes so pruning order does not depend on
+        # filesystem timestamp resolution.
+        os.utime(cache_file_for(ctx, {"risk_level": "LOW"}), ns=(create, create))
+
+    remaining = sorted(p.name for p in llm_enrichment.LLM_CACHE_DIR.iterdir())
+    assert remaining == sorted(
+        cache_file_for({"summary": {"create": create}}, {"risk_level": "LOW"}).name
+        for create in (1, 2)
+    )
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from ai.memory import memory_store
+
+
+@pytest.fixture
+def memory_files(monkeypatch, tmp_path):
+    memory_file = tmp_path / "pr_memory.jsonl"
+    legacy_file = tmp_path / "pr_memory.json"
+    monkeypatch.setattr(memory_store, "MEMORY_FILE", str(memory_file))
+    monkeypatch.setattr(memory_store, "LEGACY_MEMORY_FILE", str(legacy_file))
+    memory_store.clear_memory_caches()
+    yield memory_file, legacy_file
+    memory_store.clear_memory_caches()
+
+
+def test_legacy_memory_is_migrated_on_first_access(memory_files):
+    memory_file, legacy_file = memory_files
+    legacy_file.write_text(json.dumps({"prs": [{"pr_number": 1}, {"pr_number": 2}]}))
+
+    assert list(memory_store.iter_memory()) == [{"pr_number": 1}, {"pr_number": 2}]
+    assert [json.loads(line) for line in memory_file.read_text().splitlines()] == [
+        {"pr_number": 1},
+        {"pr_number": 2},
+    ]
+
+
+def test_record_pr_keeps_legacy_entries(memory_files):
+    _, legacy_file = memory_files
+    legacy_file.write_text(json.dumps({"prs": [{"pr_number": 1}]}))
+
+    memory_store.record_pr(2, {"environment": "prod"})
+
+    assert [pr["pr_number"] for pr in memory_store.iter_memory()] == [1, 2]
+
+
+def test_memory_index_is_cached_until_memory_is_written(memory_files):
+    memory_store.record_pr(1, {"environment": "prod", "resources": [{"type": "azurerm_subnet"}]})
+
+    first = memory_store.load_memory_index()
+    assert memory_store.load_memory_index() is first
+
+    memory_store.record_pr(2, {"environment": "prod", "resources": [{"type": "azurerm_subnet"}]})
+    prs, index = memory_store.load_memory_index()
+
+    assert [pr["pr_number"] for pr in prs] == [1, 2]
+    assert index == {"prod": {"azurerm_subnet": (0, 1)}}
+
+
+def test_similar_prs_are_copies(memory_files):
+    memory_store.record_pr(1, {"environment": "prod", "resources": [{"type": "azurerm_subnet"}]})
+
+    memory_store.find_similar_prs({"azurerm_subnet"}, "prod")[0]["resources_changed"].append("x")
+
+    assert memory_store.find_similar_prs({"azurerm_subnet"}, "prod")[0]["resources_changed"] == [
+        "azurerm_subnet"
+    ]
+
+
+def test_similar_prs_see_entries_appended_by_other_writers(memory_files):
+    memory_file, _ = memory_files
+    memory_store.record_pr(1, {"environment": "prod", "resources": [{"type": "azurerm_subnet"}]})
+    assert len(memory_store.find_similar_prs({"azurerm_subnet"}, "prod")) == 1
+
+    # Append directly, bypassing record_pr and its cache invalidation.
+    with open(memory_file, "a") as f:
+        f.write(json.dumps({
+            "pr_number": 2,
+            "environment": "prod",
+            "resources_changed": ["azurerm_subnet"],
+        }) + "\n")
+
+    similar = memory_store.find_similar_prs({"azurerm_subnet"}, "prod")
+    assert [pr["pr_number"] for pr in similar] == [1, 2]